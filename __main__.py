@@ -0,0 +1,4 @@
+from main import main
+
+# Allows starting the bot with `python3 .` from the project root.
+main()
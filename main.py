@@ -1,18 +1,18 @@
 from sys import exit as sysexit
-from src.utils.config import ConfigManager, ConfigurationError
+from src.utils.config import ConfigurationError, get_config
 from src.utils.error_handler import handle_exception
-from src.utils.logger import setup_async_logger, setup_sync_logger
+from src.utils.logger import setup_sync_logger
 
 from src.core.application import Application
 from src.core.container import Container
 
 
 def main():
-    sync_logger = setup_sync_logger()  # Synchronous logger for main.py
+    sync_logger = setup_sync_logger()  # Queue-backed logger shared by the whole app
 
     try:
         sync_logger.info("Loading configuration...")
-        config = ConfigManager()
+        config = get_config()
 
         sync_logger.debug("Retrieving bot token...")
         token = config.get("TOKEN")
@@ -27,11 +27,8 @@ def main():
         sync_logger.info("Configuration loaded successfully.")
 
         sync_logger.debug("Initializing application...")
-        container = Container()
-        async_logger = setup_async_logger()  # Asynchronous logger for the Application
-        app = Application(
-            container.bot, container, async_logger, sync_logger
-        )  # Pass both loggers
+        container = Container(config, sync_logger)
+        app = Application(container.bot, container, sync_logger)
         sync_logger.info("Application initialized successfully.")
 
         app.run(token)
@@ -4,11 +4,12 @@ from discord.ext import commands
 class UtilityCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self._pong_template = "Pong! In %dms"
 
     @commands.hybrid_command(name="ping", description="Pong!")
     async def ping(self, ctx: commands.Context):
         """Pong!"""
-        await ctx.send(f"Pong! In {round(self.bot.latency * 1000)}ms")
+        await ctx.send(self._pong_template % int(self.bot.latency * 1000.0))
 
 async def setup(bot):
     await bot.add_cog(UtilityCommands(bot))
@@ -1,15 +1,48 @@
 import asyncio
 import discord
 from discord.ext import commands
-from typing import Type
+from string import Formatter
+from typing import Any, Callable, Dict, Tuple, Type
 from src.core.container import Container
-from aiologger import Logger as AsyncLogger  # Import aiologger for type hinting
 import logging  # Import standard logging for type hinting
-from src.utils.config import ConfigManager
 
 # Import cogs
 from src.cogs.utility_commands import UtilityCommands
 
+# Compiled welcome message: (message formatter, embed template)
+WelcomeTemplate = Tuple[Callable[[str], str], discord.Embed | None]
+
+
+def _compile_welcome_message(message: str) -> Callable[[str], str]:
+    """
+    Compiles a welcome message into a function of the member's mention.
+
+    A message whose only fields are plain {user} placeholders is split around
+    them once, so each join just joins the literal parts with the mention.
+    Any other message falls back to str.format on every call.
+
+    Args:
+        message: The welcome message format string.
+    """
+    try:
+        parsed = list(Formatter().parse(message))
+    except ValueError:
+        parsed = None  # Malformed; let str.format raise at join time
+
+    if parsed is None or any(
+        field is not None and (field != "user" or spec or conversion)
+        for _, field, spec, conversion in parsed
+    ):
+        return lambda mention: message.format(user=mention)
+
+    # Literal text between {user} fields; escaped braces arrive as extra chunks
+    parts = [""]
+    for literal, field, _, _ in parsed:
+        parts[-1] += literal
+        if field is not None:
+            parts.append("")
+    return lambda mention: mention.join(parts)
+
 
 class Application:
     """
@@ -19,20 +52,34 @@ class Application:
     command synchronization, and event handling.
 
     Attributes:
-        logger: The aiologger instance for the application.
+        logger: The logger instance for the application.
         container: The dependency injection container.
         bot: The Discord bot instance.
         config_manager: The configuration manager.
-        admin_user (discord.User | None): The admin user, fetched on startup.
-        CUBE (discord.User | None): A special user, fetched on startup.
+        admin_user (discord.User | None): The admin user, fetched on first use.
+        CUBE (discord.User | None): A special user, fetched on first use.
+        SYNC_CONCURRENCY (int): Maximum number of guilds synced at once.
     """
 
+    __slots__ = (
+        "logger",
+        "bot",
+        "container",
+        "config_manager",
+        "admin_user",
+        "CUBE",
+        "_welcome_templates",
+    )
+
+    SYNC_CONCURRENCY = 8
+    ADMIN_USER_ID = 738434699021778945
+    CUBE_USER_ID = 730972218355482714
+
     def __init__(
         self,
         bot: commands.Bot,
         container: Container,
-        async_logger: AsyncLogger,
-        sync_logger: logging.Logger,
+        logger: logging.Logger,
     ):
         """
         Initializes the Application instance.
@@ -40,34 +87,76 @@ class Application:
         Args:
             bot: The Discord bot instance.
             container: The dependency injection container.
-            async_logger: The aiologger instance to use for asynchronous logging.
-            sync_logger: The standard logging instance to use for synchronous logging.
+            logger: The logger instance to use. Its records are queued and
+                written by a background thread, so logging never blocks the
+                event loop.
         """
-        self.async_logger = async_logger
-        self.sync_logger = sync_logger
+        self.logger = logger
         self.bot = bot
         self.container = container
-        self.config_manager = ConfigManager()
+        self.config_manager = container.config_manager
 
         self.admin_user: discord.User | None = None
         self.CUBE: discord.User | None = None
 
+        # Welcome templates per guild, with the config they were built from
+        self._welcome_templates: Dict[str, Tuple[Dict[str, Any], WelcomeTemplate]] = {}
+
         self.bot.setup_hook = self._async_init
 
     async def _async_init(self):
         """Performs asynchronous initialization tasks."""
-        await self.async_logger.info("Running async initialization...")
+        self.logger.info("Running async initialization...")
         await self._setup_event_handlers()
+        self._prepare_welcome_templates()
+        await asyncio.gather(self._warm_up_container(), self._setup_cogs())
+        self.logger.info("Async initialization complete.")
+
+    async def _warm_up_container(self):
+        """Starts container services, continuing without them if they fail."""
         try:
-            self.admin_user = await self.bot.fetch_user(738434699021778945)
-            await self.async_logger.info(f"Admin user: {self.admin_user.name}")
-            self.CUBE = await self.bot.fetch_user(730972218355482714)
-            await self.async_logger.info(f"CUBE user: {self.CUBE.name}")
-        except discord.NotFound:
-            await self.async_logger.warning("Could not find admin or CUBE user.")
+            await self.container.startup()
+        except Exception:
+            self.logger.warning(
+                "Container startup failed; services will retry on first use."
+            )
+
+    async def get_admin_user(self) -> discord.User | None:
+        """
+        Returns the admin user, fetching it from Discord on first use.
+
+        Returns:
+            discord.User | None: The admin user, or None if it could not be found.
+        """
+        if self.admin_user is None:
+            self.admin_user = await self._fetch_user(self.ADMIN_USER_ID)
+        return self.admin_user
+
+    async def get_cube_user(self) -> discord.User | None:
+        """
+        Returns the CUBE user, fetching it from Discord on first use.
+
+        Returns:
+            discord.User | None: The CUBE user, or None if it could not be found.
+        """
+        if self.CUBE is None:
+            self.CUBE = await self._fetch_user(self.CUBE_USER_ID)
+        return self.CUBE
+
+    async def _fetch_user(self, user_id: int) -> discord.User | None:
+        """
+        Fetches a user by ID and logs the result.
 
-        await self._setup_cogs()
-        await self.async_logger.info("Async initialization complete.")
+        Args:
+            user_id: The ID of the user to fetch.
+        """
+        try:
+            user = await self.bot.fetch_user(user_id)
+        except discord.NotFound:
+            self.logger.warning("Could not find user %s.", user_id)
+            return None
+        self.logger.info("Fetched user: %s", user.name)
+        return user
 
     async def _load_cog(self, cog_class: Type[commands.Cog]):
         """
@@ -77,23 +166,22 @@ class Application:
             cog_class: The class of the cog to load.
         """
         cog_name = cog_class.__name__
-        await self.async_logger.debug(f"Loading {cog_name} cog...")
+        self.logger.debug("Loading %s cog...", cog_name)
         try:
             await self.bot.add_cog(cog_class(self.bot))
-            await self.async_logger.info(f"{cog_name} cog loaded successfully.")
+            self.logger.info("%s cog loaded successfully.", cog_name)
         except Exception as e:
-            await self.async_logger.error(f"Failed to load cog {cog_name}: {e}")
+            self.logger.error("Failed to load cog %s: %s", cog_name, e)
             raise
 
     async def _setup_cogs(self):
         """Loads all application cogs."""
-        await self.async_logger.info("Loading cogs...")
+        self.logger.info("Loading cogs...")
         cogs_to_load = [
             UtilityCommands,
         ]
-        for cog in cogs_to_load:
-            await self._load_cog(cog)
-        await self.async_logger.info("All cogs loaded.")
+        await asyncio.gather(*(self._load_cog(cog) for cog in cogs_to_load))
+        self.logger.info("All cogs loaded.")
 
     async def _sync_guild_commands(self, guild: discord.Guild):
         """
@@ -102,56 +190,71 @@ class Application:
         Args:
             guild: The guild to sync commands for.
         """
-        await self.async_logger.info(f"Syncing commands for guild: {guild.name}")
+        self.logger.info("Syncing commands for guild: %s", guild.name)
         allowed_commands = self.config_manager.get_commands_for_guild(str(guild.id))
 
         self.bot.tree.clear_commands(guild=guild)
         if not allowed_commands:
-            await self.async_logger.info(
-                f"No commands configured for guild {guild.name}."
-            )
+            self.logger.info("No commands configured for guild %s.", guild.name)
             await self.bot.tree.sync(guild=guild)
             return
 
-        for name in allowed_commands:
-            command = self.bot.tree.get_command(name)
-            if command:
-                self.bot.tree.add_command(command, guild=guild)
-
-        await self.bot.tree.sync(guild=guild)
-        await self.async_logger.info(
-            f"Synced {len(allowed_commands)} commands for guild {guild.name}."
+        tree = self.bot.tree
+        commands_to_add = [
+            command for name in allowed_commands if (command := tree.get_command(name))
+        ]
+        for command in commands_to_add:
+            tree.add_command(command, guild=guild)
+
+        await tree.sync(guild=guild)
+        self.logger.info(
+            "Synced %d commands for guild %s.",
+            len(commands_to_add),
+            guild.name,
         )
 
     async def _setup_commands(self):
         """Synchronizes all application commands with Discord."""
-        await self.async_logger.info("Starting command synchronization...")
+        self.logger.info("Starting command synchronization...")
         approved_guild_ids = self.config_manager.get_approved_guilds()
 
+        guilds = []
+        get_guild = self.bot.get_guild
         for guild_id in approved_guild_ids:
-            guild = self.bot.get_guild(int(guild_id))
-            if not guild:
-                await self.async_logger.warning(
-                    f"Could not find guild with ID {guild_id}."
+            if guild := get_guild(guild_id):
+                guilds.append(guild)
+            else:
+                self.logger.warning("Could not find guild with ID %s.", guild_id)
+
+        # Sync guilds concurrently, bounded to stay within Discord's rate limits
+        semaphore = asyncio.Semaphore(self.SYNC_CONCURRENCY)
+
+        async def sync_with_limit(guild: discord.Guild):
+            async with semaphore:
+                await self._sync_guild_commands(guild)
+
+        results = await asyncio.gather(
+            *(sync_with_limit(guild) for guild in guilds), return_exceptions=True
+        )
+        for guild, result in zip(guilds, results):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    "Failed to sync commands for guild %s: %s", guild.name, result
                 )
-                continue
-            await self._sync_guild_commands(guild)
 
         # Clear global commands
         self.bot.tree.clear_commands(guild=None)
         await self.bot.tree.sync(guild=None)
-        await self.async_logger.info("Global commands cleared.")
-        await self.async_logger.info("Command synchronization complete.")
+        self.logger.info("Global commands cleared.")
+        self.logger.info("Command synchronization complete.")
 
     async def _check_approved_guilds(self):
         """Leaves any guilds that are not in the approved list."""
         approved_guilds = self.config_manager.get_approved_guilds()
-        for guild in self.bot.guilds:
-            if guild.id not in approved_guilds:
-                await self.async_logger.warning(
-                    f"Leaving unapproved guild: {guild.name}"
-                )
-                await guild.leave()
+        unapproved = [g for g in self.bot.guilds if g.id not in approved_guilds]
+        for guild in unapproved:
+            self.logger.warning("Leaving unapproved guild: %s", guild.name)
+        await asyncio.gather(*(guild.leave() for guild in unapproved))
 
     async def on_ready(self):
         """
@@ -161,7 +264,7 @@ class Application:
         """
         await self._setup_commands()
         await self._check_approved_guilds()
-        await self.async_logger.info(f"Logged in as {self.bot.user.name}.")  # type: ignore
+        self.logger.info("Logged in as %s.", self.bot.user.name)  # type: ignore
         await self.bot.change_presence(
             status=discord.Status.online,
             activity=discord.Game("/help #RTFM"),
@@ -195,33 +298,63 @@ class Application:
         welcome_config = server_config["welcome"]
         channel_id = welcome_config.get("channel_id")
         if not channel_id or not (channel := self.bot.get_channel(channel_id)):
-            await self.async_logger.warning(
-                f"Welcome channel not found for guild {guild_id}."
-            )
+            self.logger.warning("Welcome channel not found for guild %s.", guild_id)
             return
 
-        message_text = welcome_config.get("message", "").format(user=member.mention)
-        embed_config = welcome_config.get("embed")
-
-        embed = None
-        if embed_config:
-            embed = discord.Embed.from_dict(embed_config)
+        # The embed is shared by every join and never mutated, so it is sent as is
+        format_message, embed = self._get_welcome_template(guild_id, welcome_config)
+        message_text = format_message(member.mention)
 
         try:
             await channel.send_message(content=message_text, embed=embed)  # type: ignore
-            await self.async_logger.info(
-                f"Sent welcome to {member.name} in {member.guild.name}."
+            self.logger.info(
+                "Sent welcome to %s in %s.",
+                member.name,
+                member.guild.name,
             )
         except discord.Forbidden:
-            await self.async_logger.error(
-                f"Missing perms to send welcome in {channel.name}."  # type: ignore
+            self.logger.error(
+                "Missing perms to send welcome in %s.", channel.name  # type: ignore
             )
         except Exception as e:
-            await self.async_logger.error(f"Failed to send welcome message: {e}")
+            self.logger.error("Failed to send welcome message: %s", e)
+
+    def _prepare_welcome_templates(self):
+        """Compiles the welcome templates of every approved guild ahead of joins."""
+        for guild_id in map(str, self.config_manager.get_approved_guilds()):
+            server_config = self.config_manager.get_server_config(guild_id)
+            welcome_config = server_config.get("welcome", {})
+            if welcome_config.get("enabled"):
+                self._get_welcome_template(guild_id, welcome_config)
+
+    def _get_welcome_template(
+        self, guild_id: str, welcome_config: Dict[str, Any]
+    ) -> WelcomeTemplate:
+        """
+        Returns the compiled welcome message formatter and embed for a guild.
+
+        Templates are rebuilt only when the guild's welcome config changes
+        (e.g. after welcomer_config.json5 is edited).
+
+        Args:
+            guild_id: The ID of the guild.
+            welcome_config: The guild's "welcome" config section.
+        """
+        cached = self._welcome_templates.get(guild_id)
+        if cached is not None and cached[0] is welcome_config:
+            return cached[1]
+
+        embed_config = welcome_config.get("embed")
+        template = (
+            _compile_welcome_message(welcome_config.get("message", "")),
+            discord.Embed.from_dict(embed_config) if embed_config else None,
+        )
+        self._welcome_templates[guild_id] = (welcome_config, template)
+        return template
 
     async def _setup_event_handlers(self):
         """Registers event handlers for the bot."""
-        await self.async_logger.debug("Setting up event handlers.")
+        self.logger.debug("Setting up event handlers.")
         self.bot.event(self.on_ready)
         self.bot.event(self.on_message)
         self.bot.event(self.on_member_join)
@@ -236,5 +369,5 @@ class Application:
         try:
             self.bot.run(token)
         except Exception as e:
-            self.sync_logger.error(f"Error starting bot: {e}")
+            self.logger.error("Error starting bot: %s", e)
             raise
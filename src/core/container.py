@@ -5,33 +5,66 @@ from src.utils.validator import Validator
 from src.services.security_service import SecurityService
 from src.services.cache_service import CacheService
 from src.repositories.mongodb_repository import MongoDBRepository
+from src.utils.config import ConfigManager
 
 
 class Container:
-    def __init__(self):
+    __slots__ = (
+        "_config_manager",
+        "_logger",
+        "_validator",
+        "_security_service",
+        "_cache_service",
+        "_repository",
+        "_bot",
+    )
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logger: logging.Logger,
+    ):
+        self._config_manager = config_manager
+        self._logger = logger
+
         # Initialise core services
         self._validator = Validator()
         self._security_service = SecurityService()
         self._cache_service = CacheService()
 
         # Initialise database layer
-        self._repository = MongoDBRepository()
+        self._repository = MongoDBRepository(config_manager.get("DB"), logger)
 
         # dicsord economy abstraction not implemented
 
         # Initialise bot and related services
-        intents = discord.Intents.all()
-        logging.debug("Creating bot...\nIntents: " + str(intents))
+        # Subscribe only to the gateway events the handlers use; presences in
+        # particular are never read and would flood the event loop.
+        intents = discord.Intents.none()
+        intents.guilds = True  # Guild and channel cache for command sync
+        intents.members = True  # on_member_join
+        intents.guild_messages = True  # on_message and prefixed hybrid commands
+        intents.message_content = True
+        self._logger.debug("Creating bot... Intents: %s", intents)
         self._bot = commands.Bot(command_prefix="/", intents=intents)
-        logging.debug("Bot created successfully.")
+        self._logger.debug("Bot created successfully.")
 
         # minecraft server service not implemented
 
+    async def startup(self):
+        """Warms up services that need the event loop, such as the database."""
+        await self._repository.connect()
+
     @property
     def bot(self) -> commands.Bot:
         """Provices access to the Discord bot instance."""
         return self._bot
 
+    @property
+    def config_manager(self) -> ConfigManager:
+        """Provides access to the shared configuration manager."""
+        return self._config_manager
+
     @property
     def cache_service(self) -> CacheService:
         """Provides access to the cache service."""
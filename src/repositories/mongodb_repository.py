@@ -2,9 +2,8 @@ import motor.motor_asyncio  # type: ignore
 from motor.motor_asyncio import AsyncIOMotorClient  # type: ignore
 from src.repositories.database_repository import DatabaseRepository
 from typing import Optional, Dict, Any, List
-from src.utils.config import ConfigManager
-import asyncio
 import logging
+import asyncio
 
 
 class MongoDBRepository(DatabaseRepository):
@@ -14,50 +13,47 @@ class MongoDBRepository(DatabaseRepository):
     including finding, updating, and inserting documents.
     """
 
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-
-    _client = None  # MongoDB client instance
-    _db = None  # Database instance
+    def __init__(self, uri: str, logger: logging.Logger):
+        """
+        Initializes the repository and its MongoDB client.
 
-    @classmethod
-    async def _get_client(cls):
-        """Get or create an async MongoDB client with connection pooling.
+        The client connects lazily in the background; call connect() to
+        verify the connection before the first query.
 
-        Returns:
-            AsyncIOMotorClient: The MongoDB client instance.
+        Args:
+            uri: The MongoDB connection string.
+            logger: The logger used to report database errors.
+        """
+        self.logger = logger
+        self._client = AsyncIOMotorClient(
+            uri,
+            maxPoolSize=100,  # Maximum number of connections in the pool
+            minPoolSize=10,  # Minimum number of connections in the pool
+            connectTimeoutMS=30000,  # Connection timeout in milliseconds
+            socketTimeoutMS=30000,  # Socket timeout in milliseconds
+        )
+        self._db = self._client["psrp"]  # Access the 'psrp' database
+        self._collection_cache: Dict[str, Any] = {}  # Collection handles by path
+
+    async def connect(self):
+        """Verifies the MongoDB connection ahead of first use.
 
         Raises:
             Exception: If the connection to MongoDB fails.
         """
-        if cls._client is None:
-            config = ConfigManager()
-            cls._client = AsyncIOMotorClient(
-                config.get("DB"),
-                maxPoolSize=100,  # Maximum number of connections in the pool
-                minPoolSize=10,  # Minimum number of connections in the pool
-                connectTimeoutMS=30000,  # Connection timeout in milliseconds
-                socketTimeoutMS=30000,  # Socket timeout in milliseconds
-            )
-            try:
-                # Verify connection asynchronously
-                await cls._client.admin.command("ping")
-            except Exception as e:
-                logging.error(f"MongoDB connection failed: {str(e)}")
-                raise
-        return cls._client
-
-    @classmethod
-    async def _get_db(cls):
+        try:
+            await self._client.admin.command("ping")
+        except Exception as e:
+            self.logger.error("MongoDB connection failed: %s", e)
+            raise
+
+    def _get_db(self):
         """Get the async database instance.
 
         Returns:
             AsyncIOMotorDatabase: The MongoDB database instance.
         """
-        if cls._db is None:
-            client = await cls._get_client()
-            cls._db = client["psrp"]  # Access the 'psrp' database
-        return cls._db
+        return self._db
 
     async def _get_collection(self, collection_path: str):
         """
@@ -72,15 +68,19 @@ class MongoDBRepository(DatabaseRepository):
         Raises:
             ValueError: If the collection path is invalid.
         """
-        if not collection_path or "." not in collection_path:
+        collection = self._collection_cache.get(collection_path)
+        if collection is not None:
+            return collection
+
+        db_name, _, collection_name = collection_path.partition(".")
+        if not db_name or not collection_name:
             raise ValueError(
                 "Invalid collection path. It must be in 'database.collection' format."
             )
 
-        db_name, collection_name = collection_path.split(".", 1)
-        client = await self._get_client()
-        db = client[db_name]
-        return db[collection_name]
+        collection = self._client[db_name][collection_name]
+        self._collection_cache[collection_path] = collection
+        return collection
 
     async def find_one(self, collection: str, query: Dict[str, Any]) -> Optional[Dict]:
         """Find a single document in the specified collection asynchronously.
@@ -101,7 +101,7 @@ class MongoDBRepository(DatabaseRepository):
             return document
 
         except Exception as e:
-            logging.error(f"Database find_one error: {str(e)}")
+            self.logger.error("Database find_one error: %s", e)
             raise
 
     async def find_one_with_projection(
@@ -129,7 +129,7 @@ class MongoDBRepository(DatabaseRepository):
             return document
 
         except Exception as e:
-            logging.error(f"Database find_one_with_projection error: {str(e)}")
+            self.logger.error("Database find_one_with_projection error: %s", e)
             raise
 
     async def update_one(
@@ -159,7 +159,7 @@ class MongoDBRepository(DatabaseRepository):
 
             return result.modified_count > 0
         except Exception as e:
-            logging.error(f"Database update_one error: {str(e)}")
+            self.logger.error("Database update_one error: %s", e)
             raise
 
     async def insert_one(self, collection: str, document: Dict[str, Any]) -> bool:
@@ -181,7 +181,7 @@ class MongoDBRepository(DatabaseRepository):
 
             return result.inserted_id is not None
         except Exception as e:
-            logging.error(f"Database insert_one error: {str(e)}")
+            self.logger.error("Database insert_one error: %s", e)
             raise
 
     async def insert_scheduled_task(self, document: Dict[str, Any]) -> bool:
@@ -191,7 +191,7 @@ class MongoDBRepository(DatabaseRepository):
             result = await coll.insert_one(document)
             return result.inserted_id is not None
         except Exception as e:
-            logging.error(f"Error inserting scheduled task: {str(e)}")
+            self.logger.error("Error inserting scheduled task: %s", e)
             raise
 
     async def update_scheduled_task(
@@ -203,30 +203,30 @@ class MongoDBRepository(DatabaseRepository):
             result = await coll.update_one(query, update, upsert=upsert)
             return result.modified_count > 0
         except Exception as e:
-            logging.error(f"Error updating scheduled task: {str(e)}")
+            self.logger.error("Error updating scheduled task: %s", e)
             raise
 
-    async def find_scheduled_tasks(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def find_scheduled_tasks(
+        self, query: Dict[str, Any], limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Find scheduled task documents matching the query in the scheduled_sessions collection asynchronously."""
         try:
             coll = await self._get_collection("psrp.scheduled_sessions")
             cursor = coll.find(query)
-            results = []
-            async for document in cursor:
-                results.append(document)
-            return results
+            return await cursor.to_list(length=limit)
         except Exception as e:
-            logging.error(f"Error finding scheduled tasks: {str(e)}")
+            self.logger.error("Error finding scheduled tasks: %s", e)
             raise
 
     async def find_many(
-        self, collection: str, query: Dict[str, Any]
+        self, collection: str, query: Dict[str, Any], limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Find multiple documents in the specified collection asynchronously.
 
         Args:
             collection (str): The dot-separated collection path.
             query (Dict[str, Any]): The query to filter documents.
+            limit (Optional[int]): The maximum number of documents to return. Defaults to None (all).
 
         Returns:
             List[Dict[str, Any]]: The list of found documents.
@@ -237,10 +237,7 @@ class MongoDBRepository(DatabaseRepository):
         try:
             coll = await self._get_collection(collection)
             cursor = coll.find(query)
-            results = []
-            async for document in cursor:
-                results.append(document)
-            return results
+            return await cursor.to_list(length=limit)
         except Exception as e:
-            logging.error(f"Database find_many error: {str(e)}")
+            self.logger.error("Database find_many error: %s", e)
             raise
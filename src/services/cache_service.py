@@ -1,7 +1,11 @@
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from array import array
+from itertools import islice
 import logging
 import asyncio
+import heapq
+import sys
+import time
 
 
 class CacheService:
@@ -9,14 +13,40 @@ class CacheService:
     An asynchronous, in-memory caching service.
 
     This service provides a simple key-value store with a time-to-live (TTL)
-    for each entry. All operations are thread-safe using an asyncio.Lock.
+    for each entry. The service is meant to be used from a single event loop:
+    each operation runs without awaiting, so it cannot be interleaved with
+    other coroutines and needs no lock. It is not safe to share across threads.
+
+    Expired entries are removed lazily on read and by a background sweep task
+    that wakes when the earliest deadline is due, so unread entries do not
+    accumulate.
+
+    The cache holds at most max_entries items. Key popularity is estimated
+    with a count-min sketch of 4-bit counters (TinyLFU). When the cache is
+    full, the least popular of a few sampled entries is evicted, but only if
+    the new key is at least as popular; otherwise the new key is not stored.
     """
 
-    def __init__(self):
-        """Initializes the cache service."""
+    _MIN_SWEEP_DELAY = 0.1  # Seconds; coalesces sweeps of nearby deadlines
+    _SKETCH_WIDTH = 16384  # Counters per sketch row (power of two)
+    _SKETCH_MAX = 15  # Saturation value of a 4-bit counter
+    _EVICTION_SAMPLE = 5  # Entries compared when choosing an eviction victim
+
+    def __init__(self, max_entries: int = 10000):
+        """
+        Initializes the cache service.
+
+        Args:
+            max_entries: The maximum number of items to hold. Defaults to 10000.
+        """
         logging.info("Initialising cache service...")
-        self._cache: Dict[str, Any] = {}
-        self._lock = asyncio.Lock()
+        self._max_entries = max_entries
+        self._cache: Dict[str, Tuple[Any, float]] = {}  # key -> (value, deadline)
+        self._sketch = array("B", bytes(2 * self._SKETCH_WIDTH))  # Two rows
+        self._sketch_additions = 0
+        self._sketch_sample_size = 10 * max_entries  # Additions between agings
+        self._expiry: List[Tuple[float, str]] = []  # heap of (deadline, key)
+        self._sweeper: Optional[asyncio.Task] = None
         logging.info("Cache service initialised successfully.")
 
     async def get(self, key: str) -> Optional[Dict[str, Any]]:
@@ -29,17 +59,16 @@ class CacheService:
         Returns:
             The cached value if found and valid, otherwise None.
         """
-        async with self._lock:
-            if key not in self._cache:
-                return None
-
-            cache_entry = self._cache[key]
+        self._record_access(key)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
 
-            if datetime.now() >= cache_entry["expires"]:
-                del self._cache[key]
-                return None
+        if time.monotonic() >= entry[1]:
+            self._cache.pop(key, None)
+            return None
 
-            return cache_entry["value"]
+        return entry[0]
 
     async def set(self, key: str, value: Dict[str, Any], ttl: int = 300):
         """
@@ -50,11 +79,36 @@ class CacheService:
             value: The value to store in the cache.
             ttl: The time-to-live for the item in seconds. Defaults to 300.
         """
-        async with self._lock:
-            self._cache[key] = {
-                "value": value,
-                "expires": datetime.now() + timedelta(seconds=ttl),
-            }
+        key = sys.intern(key)  # Share one key object per distinct key string
+        self._record_access(key)
+        now = time.monotonic()
+        if (
+            key not in self._cache
+            and len(self._cache) >= self._max_entries
+            and not self._make_room(key, now)
+        ):
+            return
+
+        deadline = now + ttl
+        previous = self._cache.get(key)
+        self._cache[key] = (value, deadline)
+
+        # A key re-set with a later deadline keeps its heap entry; the sweep
+        # re-queues it when that entry comes due
+        if previous is not None and previous[1] <= deadline:
+            return
+
+        # Restart the sweeper if it is idle or sleeping well past this deadline
+        expiry = self._expiry
+        reschedule = not expiry or deadline + self._MIN_SWEEP_DELAY < expiry[0][0]
+        heapq.heappush(expiry, (deadline, key))
+        if len(expiry) > 2 * len(self._cache):
+            self._compact_expiry()
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep())
+        elif reschedule:
+            self._sweeper.cancel()
+            self._sweeper = asyncio.create_task(self._sweep())
 
     async def invalidate(self, key: str):
         """
@@ -65,8 +119,90 @@ class CacheService:
         Args:
             key: The key of the item to remove.
         """
-        async with self._lock:
-            try:
-                del self._cache[key]
-            except KeyError:
-                pass
+        self._cache.pop(key, None)
+
+    async def _sweep(self):
+        """Removes entries as they expire, exiting once nothing is left to expire."""
+        expiry = self._expiry
+        while expiry:
+            delay = expiry[0][0] - time.monotonic()
+            await asyncio.sleep(max(self._MIN_SWEEP_DELAY, delay))
+
+            now = time.monotonic()
+            while expiry and expiry[0][0] <= now:
+                deadline, key = heapq.heappop(expiry)
+                entry = self._cache.get(key)
+                if entry is None:
+                    continue  # Invalidated or evicted
+                if entry[1] <= now:
+                    del self._cache[key]
+                elif entry[1] > deadline:
+                    # Re-set with a later deadline since this was queued
+                    heapq.heappush(expiry, (entry[1], key))
+
+    def _compact_expiry(self):
+        """
+        Rebuilds the expiry heap from the live entries.
+
+        Evicted and invalidated keys leave their heap entries behind until
+        they come due; compacting once they outnumber the live entries keeps
+        the heap within twice max_entries.
+        """
+        # Updated in place, since a running sweep holds a reference to the heap
+        self._expiry[:] = [(entry[1], key) for key, entry in self._cache.items()]
+        heapq.heapify(self._expiry)
+
+    def _sketch_indexes(self, key: str) -> Tuple[int, int]:
+        """Returns the counter index of key in each sketch row."""
+        h = hash(key)
+        mask = self._SKETCH_WIDTH - 1
+        return h & mask, self._SKETCH_WIDTH + ((h >> 16) & mask)
+
+    def _frequency(self, key: str) -> int:
+        """Returns the estimated access frequency of key."""
+        first, second = self._sketch_indexes(key)
+        return min(self._sketch[first], self._sketch[second])
+
+    def _record_access(self, key: str):
+        """Increments the sketch counters of key, aging the sketch periodically."""
+        sketch = self._sketch
+        for index in self._sketch_indexes(key):
+            if sketch[index] < self._SKETCH_MAX:
+                sketch[index] += 1
+
+        self._sketch_additions += 1
+        if self._sketch_additions >= self._sketch_sample_size:
+            # Halve every counter so that old popularity fades out
+            self._sketch = array("B", (count >> 1 for count in sketch))
+            self._sketch_additions //= 2
+
+    def _make_room(self, key: str, now: float) -> bool:
+        """
+        Evicts an entry to make room for key, if key should be admitted.
+
+        The oldest few entries are sampled. An expired one is evicted
+        outright; otherwise the least frequently used is evicted when key is
+        at least as frequent.
+
+        Args:
+            key: The key about to be inserted.
+            now: The current monotonic time.
+
+        Returns:
+            bool: True if room was made for key, False if key was rejected.
+        """
+        victim = None
+        victim_frequency = self._SKETCH_MAX + 1
+        for candidate in islice(self._cache, self._EVICTION_SAMPLE):
+            if now >= self._cache[candidate][1]:
+                victim = candidate
+                break
+            frequency = self._frequency(candidate)
+            if frequency < victim_frequency:
+                victim, victim_frequency = candidate, frequency
+        else:
+            if self._frequency(key) < victim_frequency:
+                return False
+
+        del self._cache[victim]
+        return True
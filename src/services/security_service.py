@@ -1,27 +1,146 @@
-from cryptography.fernet import Fernet
+from cryptography.fernet import InvalidToken
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from src.utils.config import ConfigManager, ConfigurationError
 import logging
 import base64
+import binascii
 import hashlib
+import hmac
+import os
+import struct
+import time
+from functools import lru_cache
+from typing import List, Tuple
+
+_TOKEN_VERSION = b"\x80"  # Fernet token version byte
+_HEADER_SIZE = 1 + 8 + 16  # version + timestamp + IV
+_MAC_SIZE = 32  # HMAC-SHA256 digest
+_IV_SIZE = 16  # AES block size
+_IV_POOL_SIZE = _IV_SIZE * 256  # Random bytes fetched per os.urandom call
+
+
+@lru_cache(maxsize=4)
+def _derive_keys(secret: str) -> Tuple[bytes, bytes]:
+    """
+    Derives the (signing, encryption) key pair from a secret.
+
+    The 32-byte SHA-256 digest of the secret is split as Fernet does: the
+    first half signs, the second half encrypts. Results are cached, so each
+    secret is hashed once per process.
+    """
+    key = hashlib.sha256(secret.encode()).digest()
+    return key[:16], key[16:]
 
 
 class SecurityService:
     def __init__(self):
         self.config = ConfigManager()
         logging.info("Initialising security service...")
+        self._iv_pool = b""
+        self._iv_idx = 0
         self._initialise_encryption()
 
     def _initialise_encryption(self):
-        """Initializes the Fernet cipher using a hashed secret from config."""
+        """Derives the signing and encryption keys from a hashed secret in config."""
         secret = self.config.get("ENCRYPTION_SECRET")
         if not secret:
             raise ConfigurationError("Encryption secret not found in configuration.")
 
-        # Derive a 32-byte key from the secret
-        key = hashlib.sha256(secret.encode()).digest()
-        self.cipher = Fernet(base64.urlsafe_b64encode(key))
+        self._mac_key, self._enc_key = _derive_keys(secret)
+
+        # Keyed once; each signature copies this instead of re-keying HMAC
+        self._mac_template = hmac.new(self._mac_key, digestmod=hashlib.sha256)
+        self._algorithm = algorithms.AES(self._enc_key)
         logging.info("Security service initialised successfully.")
 
+    def _sign(self, data: bytes) -> bytes:
+        """Returns the HMAC-SHA256 signature of data under the signing key."""
+        mac = self._mac_template.copy()
+        mac.update(data)
+        return mac.digest()
+
+    def _next_iv(self) -> bytes:
+        """
+        Returns a fresh random IV, refilling the pool from os.urandom as needed.
+
+        Every IV is a distinct slice of CSPRNG output and is handed out once,
+        so this keeps the os.urandom contract at one syscall per 256 IVs.
+        """
+        index = self._iv_idx
+        if index + _IV_SIZE > len(self._iv_pool):
+            self._iv_pool = os.urandom(_IV_POOL_SIZE)
+            index = 0
+        self._iv_idx = index + _IV_SIZE
+        return self._iv_pool[index : index + _IV_SIZE]
+
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """
+        Encrypts bytes with AES-128-CBC and signs them with HMAC-SHA256.
+
+        The result is a raw (not base64-encoded) Fernet token.
+
+        Args:
+            data: The plaintext bytes to encrypt.
+
+        Returns:
+            bytes: The signed token.
+        """
+        iv = self._next_iv()
+        padder = padding.PKCS7(algorithms.AES.block_size).padder()
+        padded = padder.update(data) + padder.finalize()
+        encryptor = Cipher(self._algorithm, modes.CBC(iv)).encryptor()
+        ciphertext = encryptor.update(padded) + encryptor.finalize()
+
+        token = _TOKEN_VERSION + struct.pack(">Q", int(time.time())) + iv + ciphertext
+        return token + self._sign(token)
+
+    def encrypt_many(self, items: List[bytes]) -> List[bytes]:
+        """
+        Encrypts several byte strings in one call.
+
+        Args:
+            items: The plaintext byte strings to encrypt.
+
+        Returns:
+            List[bytes]: The signed tokens, in the same order as items.
+        """
+        encrypt = self.encrypt_bytes
+        return [encrypt(item) for item in items]
+
+    def decrypt_bytes(self, token: bytes) -> bytes:
+        """
+        Verifies and decrypts a raw token produced by encrypt_bytes.
+
+        Args:
+            token: The signed token to decrypt.
+
+        Returns:
+            bytes: The decrypted plaintext bytes.
+
+        Raises:
+            InvalidToken: If the token is malformed or its signature does not match.
+        """
+        if (
+            len(token) < _HEADER_SIZE + 16 + _MAC_SIZE
+            or token[:1] != _TOKEN_VERSION
+            or (len(token) - _HEADER_SIZE - _MAC_SIZE) % 16
+        ):
+            raise InvalidToken
+
+        signed, signature = token[:-_MAC_SIZE], token[-_MAC_SIZE:]
+        if not hmac.compare_digest(self._sign(signed), signature):
+            raise InvalidToken
+
+        iv = signed[9:_HEADER_SIZE]
+        decryptor = Cipher(self._algorithm, modes.CBC(iv)).decryptor()
+        padded = decryptor.update(signed[_HEADER_SIZE:]) + decryptor.finalize()
+        unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+        try:
+            return unpadder.update(padded) + unpadder.finalize()
+        except ValueError as e:
+            raise InvalidToken from e
+
     def encrypt(self, data: str) -> str:
         """
         Encrypts a string using the initialized cipher.
@@ -30,18 +149,22 @@ class SecurityService:
             data: The plaintext string to encrypt.
 
         Returns:
-            str: The encrypted string.
+            str: The encrypted string (a Fernet token).
         """
-        return self.cipher.encrypt(data.encode()).decode()
+        return base64.urlsafe_b64encode(self.encrypt_bytes(data.encode())).decode()
 
     def decrypt(self, data: str) -> str:
         """
         Decrypts a string using the initialized cipher.
 
         Args:
-            data: The encrypted string to decrypt.
+            data: The encrypted string (a Fernet token) to decrypt.
 
         Returns:
             str: The decrypted plaintext string.
         """
-        return self.cipher.decrypt(data.encode()).decode()
+        try:
+            token = base64.urlsafe_b64decode(data.encode())
+        except (TypeError, binascii.Error) as e:
+            raise InvalidToken from e
+        return self.decrypt_bytes(token).decode()
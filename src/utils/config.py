@@ -1,12 +1,30 @@
 from dotenv import load_dotenv
+from functools import lru_cache
 import logging
 import os
 import json
 import json5
+import sys
+import time
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, FrozenSet, Tuple
 from datetime import datetime
 
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
 
 # Custom Exception for Configuration Errors
 class ConfigurationError(Exception):
@@ -34,6 +52,7 @@ def load_and_validate_env_vars(required_vars: List[str]):
 def get_env_var(key: str, default: Any = None) -> Any:
     """
     Retrieves a single environment variable.
+    Reads the live environment; ConfigManager.get uses a snapshot instead.
     """
     return os.getenv(key, default)
 
@@ -45,7 +64,7 @@ def get_env_var_as_list(key: str, default: List[str] | None = None) -> List[str]
     value = get_env_var(key)
     if value is None:
         return default if default is not None else []
-    return [item.strip().strip('"') for item in value.split(",") if item.strip()]
+    return [s for s in (item.strip().strip('"') for item in value.split(",")) if s]
 
 
 # --- JSON File Repository for Command Configuration ---
@@ -57,9 +76,15 @@ class CommandConfigRepository:
     This class is responsible for reading, writing, and backing up the command configuration.
     """
 
+    BACKUP_INTERVAL = 5.0  # Minimum seconds between automatic backups
+
     def __init__(self, config_path: Path, backup_dir: Path):
         self.config_path = config_path
         self.backup_dir = backup_dir
+        # Parsed config and the file modification time it was read at
+        self._cached: Dict[str, Any] | None = None
+        self._cached_mtime = -1
+        self._last_backup_ts = float("-inf")
         self._ensure_config_exists()
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
@@ -72,10 +97,20 @@ class CommandConfigRepository:
             self._write_config({"guilds": {}})
 
     def _read_config(self) -> Dict[str, Any]:
-        """Reads and decodes the JSON configuration file."""
+        """
+        Reads and decodes the JSON configuration file.
+
+        The parsed result is cached and reused until the file's modification
+        time changes.
+        """
         try:
-            with self.config_path.open("r") as f:
-                return json.load(f)
+            mtime = self.config_path.stat().st_mtime_ns
+            if mtime == self._cached_mtime and self._cached is not None:
+                return self._cached
+
+            config = _loads(self.config_path.read_bytes())
+            self._cached, self._cached_mtime = config, mtime
+            return config
         except (FileNotFoundError, json.JSONDecodeError, TypeError) as e:
             logging.error(f"Error reading command configuration: {e}")
             raise ConfigurationError(
@@ -85,9 +120,10 @@ class CommandConfigRepository:
     def _write_config(self, data: Dict[str, Any]):
         """Writes data to the JSON configuration file."""
         try:
-            with self.config_path.open("w") as f:
-                json.dump(data, f, indent=2)
+            self.config_path.write_bytes(_dumps(data))
+            self._cached, self._cached_mtime = data, self.config_path.stat().st_mtime_ns
         except (IOError, TypeError) as e:
+            self._cached, self._cached_mtime = None, -1
             logging.error(f"Error writing command configuration: {e}")
             raise ConfigurationError(f"Failed to write to {self.config_path}") from e
 
@@ -104,27 +140,38 @@ class CommandConfigRepository:
         """Updates the command list for a specific guild."""
         if not isinstance(commands, list):
             raise ConfigurationError("Invalid commands list: must be a list.")
-
-        self.backup()  # Backup before making changes
+        guild_id = sys.intern(guild_id)  # Stored as a key in the guilds dict
 
         config = self.get_all()
+        # Backup before making changes. A backup taken less than
+        # BACKUP_INTERVAL seconds ago already holds the state before this
+        # burst of updates, so no new file is written.
+        if time.monotonic() - self._last_backup_ts >= self.BACKUP_INTERVAL:
+            self.backup(config)
+
         if "guilds" not in config:
             config["guilds"] = {}
         config["guilds"][guild_id] = commands
         self._write_config(config)
         logging.info(f"Updated command configuration for guild {guild_id}.")
 
-    def backup(self):
-        """Creates a timestamped backup of the current command configuration."""
+    def backup(self, config: Dict[str, Any] | None = None):
+        """
+        Creates a timestamped backup of the command configuration.
+
+        Args:
+            config: The configuration to back up. Read from disk if omitted.
+        """
         try:
-            config = self._read_config()
+            if config is None:
+                config = self._read_config()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = (
                 self.backup_dir / f"{self.config_path.stem}_backup_{timestamp}.json"
             )
 
-            with backup_file.open("w") as f:
-                json.dump(config, f, indent=2)
+            backup_file.write_bytes(_dumps(config))
+            self._last_backup_ts = time.monotonic()
             logging.info(f"Created configuration backup at {backup_file}")
         except Exception as e:
             logging.error(f"Error creating config backup: {e}")
@@ -155,22 +202,44 @@ class CommandConfigRepository:
 # --- JSON5 Server Configuration ---
 
 
+# Parsed server config files: path -> (mtime_ns, size, parsed contents)
+_SERVER_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _read_server_configs(config_path: Path) -> Dict[str, Any]:
+    """Reads and parses the server configuration file."""
+    raw = config_path.read_bytes()
+    try:
+        # Fast path for files that are plain JSON
+        return _loads(raw)
+    except ValueError:
+        return json5.loads(raw.decode())
+
+
 def get_server_config(guild_id: str, config_path: Path) -> Dict[str, Any]:
     """
     Reads a server's configuration from a JSON5 file.
+    The parsed file is cached until its modification time or size changes.
     Returns an empty dictionary if the file doesn't exist or an error occurs.
     """
-    if not config_path.exists():
-        return {}
-
     try:
-        with config_path.open("r") as f:
-            all_configs = json5.load(f)
-            return all_configs.get(guild_id, {})
-    except (json.JSONDecodeError, IOError) as e:
-        logging.error(f"Error reading server config for guild {guild_id}: {e}")
+        st = os.stat(config_path)
+    except FileNotFoundError:
         return {}
 
+    cache_key = str(config_path)
+    cached = _SERVER_CONFIG_CACHE.get(cache_key)
+    if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+        try:
+            all_configs = _read_server_configs(config_path)
+        except (ValueError, IOError) as e:
+            logging.error(f"Error reading server config for guild {guild_id}: {e}")
+            return {}
+        cached = (st.st_mtime_ns, st.st_size, all_configs)
+        _SERVER_CONFIG_CACHE[cache_key] = cached
+
+    return cached[2].get(guild_id, {})
+
 
 # --- Main Config Facade ---
 
@@ -180,19 +249,35 @@ class ConfigManager:
     A facade for accessing various configuration sources.
     It provides a single point of entry for configuration needs, delegating
     to specialized functions or classes for handling the details.
+
+    The class is a singleton: every ConfigManager() call returns the same
+    instance, and the environment and config files are only set up once.
     """
 
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
     def __init__(self):
+        if self._initialized:
+            return
         logging.info("Initializing configuration manager...")
         self._setup_env_vars()
         self._setup_command_config_repo()
         self._setup_server_config()
+        self._initialized = True
         logging.info("Configuration manager initialized successfully.")
 
     def _setup_env_vars(self):
         """Loads and validates required environment variables."""
         self.required_env_vars = ["APPROVED_GUILDS", "TOKEN", "DB"]
         load_and_validate_env_vars(self.required_env_vars)
+        # Snapshot the environment (including .env values) for fast lookups
+        self._env = dict(os.environ)
         logging.info("Environment variables validated.")
 
     def _setup_command_config_repo(self):
@@ -209,18 +294,21 @@ class ConfigManager:
 
     # --- Environment Variable Access ---
     def get(self, key: str, default: Any = None) -> Any:
-        return get_env_var(key, default)
+        """Returns a variable from the environment snapshot taken at startup."""
+        return self._env.get(key, default)
 
-    def get_approved_guilds(self) -> List[int]:
+    @lru_cache(maxsize=None)
+    def get_approved_guilds(self) -> FrozenSet[int]:
         guild_ids_str = get_env_var_as_list("APPROVED_GUILDS")
-        return [int(gid) for gid in guild_ids_str if gid.isdigit()]
+        return frozenset(int(gid) for gid in guild_ids_str if gid.isdigit())
 
     # --- Command Config Access (via Repository) ---
     def get_command_config(self) -> Dict[str, Any]:
         return self.command_config_repo.get_all()
 
     def get_commands_for_guild(self, guild_id: str) -> List[str]:
-        return self.command_config_repo.get_commands_for_guild(guild_id)
+        # A copy, so callers cannot mutate the repository's cached config
+        return list(self.command_config_repo.get_commands_for_guild(guild_id))
 
     def update_command_config(self, guild_id: str, commands: List[str]):
         self.command_config_repo.update_commands_for_guild(guild_id, commands)
@@ -229,3 +317,9 @@ class ConfigManager:
     def get_server_config(self, guild_id: str) -> Dict[str, Any]:
         return get_server_config(guild_id, self.server_config_file)
 
+
+def get_config() -> ConfigManager:
+    """
+    Returns the process-wide ConfigManager, creating it on first use.
+    """
+    return ConfigManager()
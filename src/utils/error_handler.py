@@ -1,9 +1,13 @@
-from aiologger import Logger
+import logging
+from logging import Logger
+
 
 class ApplicationError(Exception):
     """Custom exception for application-specific errors."""
+
     pass
 
+
 def handle_exception(
     logger: Logger,
     exception: Exception,
@@ -19,9 +23,15 @@ def handle_exception(
         message: A descriptive message about the context of the error.
         reraise: If True, the exception will be re-raised after logging.
     """
-    error_type = type(exception).__name__
-    error_message = str(exception)
-    logger.error(f"{message}: {error_type} - {error_message}", exc_info=True)
+    if logger.isEnabledFor(logging.ERROR):
+        # Passing the exception itself spares logging a sys.exc_info() lookup
+        logger.error(
+            "%s: %s - %s",
+            message,
+            type(exception).__name__,
+            exception,
+            exc_info=exception,
+        )
 
     if reraise:
-        raise exception
\ No newline at end of file
+        raise exception
@@ -1,35 +1,16 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from aiologger import Logger
-from aiologger.levels import LogLevel
-from aiologger.formatters.base import Formatter
-from aiologger.handlers.streams import AsyncStreamHandler
-from aiologger.handlers.files import AsyncFileHandler
 
 
-def setup_async_logger():
-    """
-    Configures and returns an asynchronous logger (aiologger).
-    """
-    logger = Logger(name="application", level=LogLevel.INFO)
-
-    # Formatter
-    formatter = Formatter(fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-
-    # Handlers
-    stream_handler = AsyncStreamHandler()
-    stream_handler.formatter = formatter
-    logger.add_handler(stream_handler)
-
-    file_handler = AsyncFileHandler(filename="app.log")
-    file_handler.formatter = formatter
-    logger.add_handler(file_handler)
-
-    return logger
-
 def setup_sync_logger():
     """
     Configures and returns a synchronous logger (standard logging).
+
+    Records are put on a queue by a QueueHandler and written out by a
+    QueueListener thread, so logging calls never block on stream or file I/O.
     """
     logger = logging.getLogger("main")
     logger.setLevel(logging.INFO)
@@ -42,11 +23,25 @@ def setup_sync_logger():
     # Console Handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
-    # File Handler
-    file_handler = logging.FileHandler("main.log")
+    # File Handler, size-rotated and buffered so records are written in batches.
+    # delay=True defers opening main.log until the first flush.
+    file_handler = logging.handlers.RotatingFileHandler(
+        "main.log", maxBytes=10 * 1024 * 1024, backupCount=5, delay=True
+    )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.WARNING, target=file_handler
+    )
+
+    # Queue Handler, drained by the listener thread into the real handlers
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, buffered_file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)  # Flush queued records on shutdown
 
     return logger
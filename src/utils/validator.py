@@ -2,6 +2,13 @@ from typing import Any, Dict
 import logging
 import re
 
+logger = logging.getLogger(__name__)
+
+# Characters accepted by Validator.validate_string
+_STRING_RE = re.compile(r"[\w\s\-.,!?]+")
+# The ASCII subset of those characters, for a regex-free scan of ASCII input
+_ASCII_ALLOWED = bytes(i for i in range(128) if _STRING_RE.fullmatch(chr(i)))
+
 
 class Validator:
     def __init__(self):
@@ -17,8 +24,10 @@ class Validator:
         Returns:
             bool: True if valid, False otherwise.
         """
-        logging.debug(f"Validating user ID: {user_id}")
-        return isinstance(user_id, int) and user_id > 0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validating user ID: %s", user_id)
+        # Exact type check: bools (an int subclass) are not valid IDs
+        return type(user_id) is int and user_id > 0
 
     def validate_string(
         self, value: Any, min_length: int = 1, max_length: int = 255
@@ -36,14 +45,18 @@ class Validator:
         Returns:
             bool: True if the string is valid, False otherwise.
         """
-        logging.debug(f"Validating string: {value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validating string: %s", value)
         if not isinstance(value, str):
             return False
 
         if not (min_length <= len(value) <= max_length):
             return False
 
-        return bool(re.match(r"^[\w\s\-.,!?]+$", value))
+        if value.isascii():
+            # Deleting every allowed byte leaves nothing if the string is valid
+            return bool(value) and not value.encode().translate(None, _ASCII_ALLOWED)
+        return _STRING_RE.fullmatch(value) is not None
 
     def validate_number(
         self, value: Any, min_value: float = 0, max_value: float = 9999999
@@ -59,7 +72,8 @@ class Validator:
         Returns:
             bool: True if the value is a number within range, False otherwise.
         """
-        logging.debug(f"Validating number: {value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validating number: %s", value)
         try:
             num = float(value)
             return min_value <= num <= max_value
@@ -80,11 +94,15 @@ class Validator:
         Returns:
             Dict[str, Any]: A new dictionary with sanitized values.
         """
-        logging.debug(f"Sanitizing input: {data}")
-        sanitized = {}
-        for key, value in data.items():
-            if value is None or isinstance(value, (int, float)):
-                sanitized[key] = value
-            else:
-                sanitized[key] = str(value).strip()
-        return sanitized
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sanitizing input: %s", data)
+        numeric = (int, float)
+        is_instance = isinstance
+        return {
+            key: (
+                value
+                if value is None or is_instance(value, numeric)
+                else str(value).strip()
+            )
+            for key, value in data.items()
+        }
@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+
+from src.services.cache_service import CacheService
+
+SHORT_TTL = 0.2  # Seconds; above CacheService._MIN_SWEEP_DELAY
+SETTLE = 0.25  # Slack for the sweeper to wake after a deadline
+
+
+class CacheServiceExpiryTest(unittest.IsolatedAsyncioTestCase):
+    """Checks TTL handling and the background sweep."""
+
+    def setUp(self):
+        self.cache = CacheService()
+
+    async def test_get_returns_value_before_expiry(self):
+        await self.cache.set("key", {"v": 1}, ttl=300)
+        self.assertEqual(await self.cache.get("key"), {"v": 1})
+        self.assertIsNone(await self.cache.get("missing"))
+
+    async def test_sweeper_removes_expired_entries(self):
+        await self.cache.set("key", {"v": 1}, ttl=SHORT_TTL)
+        await asyncio.sleep(SHORT_TTL + SETTLE)
+        # Checked on the store itself, since get() would also expire lazily
+        self.assertNotIn("key", self.cache._cache)
+        self.assertEqual(self.cache._expiry, [])
+
+    async def test_reset_with_longer_ttl_extends_entry(self):
+        await self.cache.set("key", {"v": 1}, ttl=SHORT_TTL)
+        await self.cache.set("key", {"v": 2}, ttl=3 * SHORT_TTL)
+        self.assertEqual(len(self.cache._expiry), 1)
+
+        await asyncio.sleep(SHORT_TTL + SETTLE)
+        self.assertEqual(await self.cache.get("key"), {"v": 2})
+        self.assertEqual(len(self.cache._expiry), 1)  # Re-queued, not duplicated
+
+        await asyncio.sleep(2 * SHORT_TTL)
+        self.assertNotIn("key", self.cache._cache)
+
+    async def test_reset_with_shorter_ttl_expires_early(self):
+        await self.cache.set("other", {}, ttl=300)
+        await self.cache.set("key", {"v": 1}, ttl=300)
+        await self.cache.set("key", {"v": 2}, ttl=SHORT_TTL)
+        await asyncio.sleep(SHORT_TTL + SETTLE)
+        self.assertNotIn("key", self.cache._cache)
+        self.assertIn("other", self.cache._cache)
+
+    async def test_invalidate_then_set(self):
+        await self.cache.set("key", {"v": 1}, ttl=SHORT_TTL)
+        await self.cache.invalidate("key")
+        self.assertIsNone(await self.cache.get("key"))
+
+        await self.cache.set("key", {"v": 2}, ttl=300)
+        # The stale heap entry from the first set must not expire the new one
+        await asyncio.sleep(SHORT_TTL + SETTLE)
+        self.assertEqual(await self.cache.get("key"), {"v": 2})
+
+        await self.cache.invalidate("missing")  # No-op
+
+
+class CacheServiceBoundsTest(unittest.IsolatedAsyncioTestCase):
+    """Checks the size bound and TinyLFU admission."""
+
+    async def test_heap_stays_within_twice_max_entries(self):
+        cache = CacheService(max_entries=100)
+        limit = 2 * 100 + 1
+        for i in range(1000):
+            await cache.set("hot", {"i": i}, ttl=300)
+        self.assertEqual(len(cache._expiry), 1)
+
+        for i in range(1000):
+            key = f"key{i}"
+            await cache.set(key, {}, ttl=300 - i % 7)
+            await cache.get(key)
+            if i % 3 == 0:
+                await cache.invalidate(key)
+            self.assertLessEqual(len(cache._cache), 100)
+            self.assertLessEqual(len(cache._expiry), limit)
+
+        # Every live entry still has a heap entry, so all of them can expire
+        self.assertLessEqual(set(cache._cache), {key for _, key in cache._expiry})
+
+    async def test_admission_rejects_cold_key_when_full(self):
+        cache = CacheService(max_entries=2)
+        for key in ("a", "b"):
+            await cache.set(key, {"key": key}, ttl=300)
+            for _ in range(5):
+                await cache.get(key)
+
+        await cache.set("cold", {}, ttl=300)
+        self.assertIsNone(await cache.get("cold"))
+        self.assertEqual(set(cache._cache), {"a", "b"})
+
+        # A key requested more often than the residents is admitted
+        for _ in range(10):
+            await cache.get("popular")
+        await cache.set("popular", {}, ttl=300)
+        self.assertEqual(await cache.get("popular"), {})
+        self.assertEqual(len(cache._cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.utils import config as config_module
+from src.utils.config import ConfigManager
+
+ENV = {"APPROVED_GUILDS": "1", "TOKEN": "token", "DB": "mongodb://localhost"}
+
+
+def write_edited(path: Path, text: str):
+    """Rewrites a file and moves its mtime forward, as a later edit would."""
+    stat = path.stat() if path.exists() else None
+    path.write_text(text)
+    if stat is not None:
+        mtime = stat.st_mtime_ns + 1_000_000_000
+        os.utime(path, ns=(mtime, mtime))
+
+
+class ConfigManagerFileEditTest(unittest.TestCase):
+    """Checks that ConfigManager picks up edits made to its config files."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)  # ConfigManager uses paths relative to cwd
+        self.addCleanup(self._restore)
+
+        env = mock.patch.dict(os.environ, ENV)
+        env.start()
+        self.addCleanup(env.stop)
+
+        ConfigManager._instance = None
+        config_module._SERVER_CONFIG_CACHE.clear()  # Keyed by relative path
+        self.config = ConfigManager()
+
+    def _restore(self):
+        ConfigManager._instance = None
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_commands_for_guild_follow_file_edits(self):
+        path = Path("command_config.json")
+        write_edited(path, json.dumps({"guilds": {"1": ["ping"]}}))
+        commands = self.config.get_commands_for_guild("1")
+        self.assertEqual(commands, ["ping"])
+
+        commands.append("mutated")  # Must not leak into the cached config
+        self.assertEqual(self.config.get_commands_for_guild("1"), ["ping"])
+
+        write_edited(path, json.dumps({"guilds": {"1": ["ping", "help"]}}))
+        self.assertEqual(self.config.get_commands_for_guild("1"), ["ping", "help"])
+
+    def test_server_config_follows_file_edits(self):
+        path = Path("welcomer_config.json5")
+        write_edited(path, '{"1": {welcome: {enabled: true, n: 1}}, // comment\n}')
+        self.assertEqual(
+            self.config.get_server_config("1"), {"welcome": {"enabled": True, "n": 1}}
+        )
+        self.assertEqual(self.config.get_server_config("2"), {})
+
+        # Same size, so only the modification time tells the edit apart
+        write_edited(path, '{"1": {welcome: {enabled: true, n: 2}}, // comment\n}')
+        self.assertEqual(
+            self.config.get_server_config("1"), {"welcome": {"enabled": True, "n": 2}}
+        )
+
+        write_edited(path, '{"1": {"welcome": {"enabled": false}}}')
+        self.assertEqual(
+            self.config.get_server_config("1"), {"welcome": {"enabled": False}}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
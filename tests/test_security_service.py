@@ -0,0 +1,86 @@
+import base64
+import hashlib
+import unittest
+from unittest import mock
+
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from src.services.security_service import SecurityService
+
+SECRET = "test-secret"
+
+
+def make_service() -> SecurityService:
+    """Builds a SecurityService whose config only holds the encryption secret."""
+    config = {"ENCRYPTION_SECRET": SECRET}
+    with mock.patch("src.services.security_service.ConfigManager", return_value=config):
+        return SecurityService()
+
+
+class SecurityServiceFernetTest(unittest.TestCase):
+    """Checks the hand-built token format against cryptography's Fernet."""
+
+    def setUp(self):
+        self.service = make_service()
+        key = base64.urlsafe_b64encode(hashlib.sha256(SECRET.encode()).digest())
+        self.fernet = Fernet(key)
+
+    def test_fernet_decrypts_service_tokens(self):
+        for text in ("", "a", "x" * 15, "y" * 16, "z" * 17, "héllo wörld" * 40):
+            with self.subTest(length=len(text)):
+                token = self.service.encrypt(text)
+                self.assertEqual(self.fernet.decrypt(token.encode()).decode(), text)
+
+    def test_service_decrypts_fernet_tokens(self):
+        for text in ("", "a", "y" * 16, "héllo wörld" * 40):
+            with self.subTest(length=len(text)):
+                token = self.fernet.encrypt(text.encode()).decode()
+                self.assertEqual(self.service.decrypt(token), text)
+
+    def test_raw_tokens_round_trip(self):
+        items = [b"", b"one", bytes(range(256))]
+        tokens = self.service.encrypt_many(items)
+        self.assertEqual([self.service.decrypt_bytes(t) for t in tokens], items)
+        self.assertEqual(len({t[9:25] for t in tokens}), len(tokens))  # Fresh IVs
+
+    def test_tampered_token_is_rejected(self):
+        token = bytearray(self.service.encrypt_bytes(b"payload"))
+        for index in (0, 5, 20, 30, len(token) - 1):
+            with self.subTest(index=index):
+                tampered = bytearray(token)
+                tampered[index] ^= 0x01
+                with self.assertRaises(InvalidToken):
+                    self.service.decrypt_bytes(bytes(tampered))
+
+    def test_malformed_tokens_are_rejected(self):
+        token = self.service.encrypt_bytes(b"payload")
+        for bad in (b"", token[:-1], token[:40], token + b"\x00"):
+            with self.subTest(length=len(bad)):
+                with self.assertRaises(InvalidToken):
+                    self.service.decrypt_bytes(bad)
+        with self.assertRaises(InvalidToken):
+            self.service.decrypt("not base64!")
+
+    def test_bad_padding_is_rejected(self):
+        # A correctly signed token whose plaintext has invalid PKCS7 padding
+        service = self.service
+        iv = bytes(16)
+        encryptor = Cipher(service._algorithm, modes.CBC(iv)).encryptor()
+        ciphertext = encryptor.update(b"\x00" * 16) + encryptor.finalize()
+        signed = b"\x80" + bytes(8) + iv + ciphertext
+        with self.assertRaises(InvalidToken):
+            service.decrypt_bytes(signed + service._sign(signed))
+
+        # The same framing with valid padding decrypts, so padding is the cause
+        padder = padding.PKCS7(algorithms.AES.block_size).padder()
+        padded = padder.update(b"ok") + padder.finalize()
+        encryptor = Cipher(service._algorithm, modes.CBC(iv)).encryptor()
+        ciphertext = encryptor.update(padded) + encryptor.finalize()
+        signed = b"\x80" + bytes(8) + iv + ciphertext
+        self.assertEqual(service.decrypt_bytes(signed + service._sign(signed)), b"ok")
+
+
+if __name__ == "__main__":
+    unittest.main()